@@ -12,73 +12,158 @@ Usage:
     python folder_tree.py <path> --depth 2                # limit depth
     python folder_tree.py <path> --exclude .git node_modules
     python folder_tree.py <path> --include "*.md" "*.txt" # only these files
+    python folder_tree.py <path> --jobs 1                 # disable threaded scanning
+    python folder_tree.py <path> --no-skip-hidden         # descend into dot-directories
 
 No admin privileges or third-party packages required — pure Python 3.
 """
 
 import argparse
 import fnmatch
+import functools
+import io
 import os
+import re
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain
 
 
-def build_tree(
+def _scan_dir(path, dirs_only, exclude, include, skip_hidden):
+    """List one directory, returning sorted (dirs, files) or None if unreadable."""
+    try:
+        with os.scandir(path) as it:
+            # Decorate-sort-undecorate: the type bit (cached on DirEntry, so
+            # no extra stat calls) and the folded name are computed once per
+            # entry rather than once per comparison; the index keeps
+            # DirEntry objects out of the tuple comparisons.
+            decorated = [
+                (not e.is_dir(follow_symlinks=False), e.name.casefold(), i, e)
+                for i, e in enumerate(it)
+            ]
+    except OSError:
+        return None
+    decorated.sort()
+
+    # Separate dirs and files, reusing the decorated type bit. The one-char
+    # dotfile test runs before the set lookup so hidden dirs (the common
+    # exclusion in Obsidian vaults) never reach it.
+    dirs = [
+        e for is_file, _, _, e in decorated
+        if not is_file
+        and not (skip_hidden and e.name[:1] == ".")
+        and e.name not in exclude
+    ]
+
+    if dirs_only:
+        files = []
+    else:
+        files = [e for is_file, _, _, e in decorated if is_file]
+        # Apply include filter to files (if specified; arrives as a matcher callable)
+        if include:
+            files = [e for e in files if include(e.name)]
+
+    return dirs, files
+
+
+def walk_tree(
     root,
-    prefix="",
     dirs_only=False,
     max_depth=None,
-    current_depth=0,
     exclude=None,
     include=None,
+    jobs=None,
+    skip_hidden=True,
 ):
-    """Recursively build a list of lines representing the folder tree."""
-    if max_depth is not None and current_depth >= max_depth:
-        return []
+    """Yield the lines of the folder tree one at a time (depth-first).
+
+    Iterative with an explicit stack, so deep vaults neither hit the
+    recursion limit nor hold every line in memory; peak memory is
+    O(depth), and the first line is available immediately.
+
+    With jobs > 1 (the default), directory scans run on a thread pool:
+    a subtree's scan is submitted as soon as its parent is listed, so
+    syscall latency on slow filesystems (network shares, OneDrive
+    vaults) overlaps instead of serialising. Results are still consumed
+    in depth-first order, so the output is identical either way.
+    """
+    # Hash lookups instead of a linear scan per entry, at every level
+    exclude = frozenset(exclude or ())
+    # Compile each glob once up front; fnmatch.fnmatch would re-translate
+    # every pattern for every file at every level. The matcher is also
+    # memoised per run — vaults repeat names like README.md or daily notes
+    # across folders, so repeats collapse to a dict lookup.
+    if include:
+        include_re = tuple(re.compile(fnmatch.translate(pat)) for pat in include)
+
+        @functools.lru_cache(maxsize=8192)
+        def include(name):
+            return any(r.match(name) for r in include_re)
+
+    if jobs is None:
+        jobs = min(32, (os.cpu_count() or 1) * 4)
 
-    exclude = exclude or []
+    pool = ThreadPoolExecutor(max_workers=jobs) if jobs > 1 else None
+    if pool is not None:
+        def schedule(path):
+            return pool.submit(_scan_dir, path, dirs_only, exclude, include, skip_hidden)
+
+        def resolve(task):
+            return task.result()
+    else:
+        # Serial fallback: defer the scan until the item is popped
+        def schedule(path):
+            return path
+
+        def resolve(task):
+            return _scan_dir(task, dirs_only, exclude, include, skip_hidden)
+
+    # Stack holds ("emit", line) and ("scan", task, prefix, depth) items;
+    # pushing a directory's children in reverse preserves DFS order.
+    stack = []
+    if max_depth is None or max_depth > 0:
+        stack.append(("scan", schedule(root), "", 0))
 
     try:
-        entries = sorted(os.listdir(root), key=lambda s: (not os.path.isdir(os.path.join(root, s)), s.lower()))
-    except PermissionError:
-        return [f"{prefix}[access denied]"]
+        while stack:
+            item = stack.pop()
+            # Emit items are plain ("emit", line) pairs — the common case by
+            # far — so they skip the full scan-tuple unpack
+            if item[0] == "emit":
+                yield item[1]
+                continue
+            _, payload, prefix, depth = item
 
-    # Separate dirs and files
-    dirs = [e for e in entries if os.path.isdir(os.path.join(root, e)) and e not in exclude]
-    files = [e for e in entries if not os.path.isdir(os.path.join(root, e))]
+            scanned = resolve(payload)
+            if scanned is None:
+                yield f"{prefix}[access denied]"
+                continue
+            dirs, files = scanned
 
-    # Apply include filter to files (if specified)
-    if include:
-        files = [f for f in files if any(fnmatch.fnmatch(f, pat) for pat in include)]
+            # Iterate both sequences in place; concatenating them only to
+            # learn the combined length would copy every entry
+            n_dirs = len(dirs)
+            last = n_dirs + len(files) - 1
+            pending = []
+            append = pending.append
+            descend = max_depth is None or depth + 1 < max_depth
 
-    if dirs_only:
-        files = []
+            for i, entry in enumerate(chain(dirs, files)):
+                is_last = i == last
+                connector = "└── " if is_last else "├── "
 
-    items = dirs + files
-    lines = []
-
-    for i, name in enumerate(items):
-        is_last = i == len(items) - 1
-        connector = "└── " if is_last else "├── "
-        full_path = os.path.join(root, name)
-
-        if os.path.isdir(full_path):
-            lines.append(f"{prefix}{connector}{name}/")
-            extension = "    " if is_last else "│   "
-            lines.extend(
-                build_tree(
-                    full_path,
-                    prefix=prefix + extension,
-                    dirs_only=dirs_only,
-                    max_depth=max_depth,
-                    current_depth=current_depth + 1,
-                    exclude=exclude,
-                    include=include,
-                )
-            )
-        else:
-            lines.append(f"{prefix}{connector}{name}")
-
-    return lines
+                if i < n_dirs:
+                    append(("emit", f"{prefix}{connector}{entry.name}/"))
+                    if descend:
+                        extension = "    " if is_last else "│   "
+                        append(("scan", schedule(entry.path), prefix + extension, depth + 1))
+                else:
+                    append(("emit", f"{prefix}{connector}{entry.name}"))
+
+            stack.extend(reversed(pending))
+    finally:
+        if pool is not None:
+            pool.shutdown(wait=False, cancel_futures=True)
 
 
 def generate_tree(
@@ -87,20 +172,27 @@ def generate_tree(
     max_depth=None,
     exclude=None,
     include=None,
+    jobs=None,
+    skip_hidden=True,
 ):
     """Return the full tree as a string."""
     root_name = os.path.basename(os.path.abspath(path)) or path
-    lines = [f"{root_name}/"]
-    lines.extend(
-        build_tree(
-            path,
-            dirs_only=dirs_only,
-            max_depth=max_depth,
-            exclude=exclude,
-            include=include,
-        )
-    )
-    return "\n".join(lines)
+    # Write into one buffer instead of collecting every line and joining
+    out = io.StringIO()
+    out.write(root_name)
+    out.write("/")
+    for line in walk_tree(
+        path,
+        dirs_only=dirs_only,
+        max_depth=max_depth,
+        exclude=exclude,
+        include=include,
+        jobs=jobs,
+        skip_hidden=skip_hidden,
+    ):
+        out.write("\n")
+        out.write(line)
+    return out.getvalue()
 
 
 def main():
@@ -131,6 +223,18 @@ examples:
         default=None,
         help='Only show files matching these patterns (e.g. "*.md" "*.txt")',
     )
+    parser.add_argument(
+        "--skip-hidden",
+        action=argparse.BooleanOptionalAction,
+        default=True,
+        help="Skip dot-directories like .git and .obsidian (default: on)",
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=None,
+        help="Worker threads for scanning (default: auto; 1 disables threading)",
+    )
 
     args = parser.parse_args()
 
@@ -138,20 +242,34 @@ examples:
         print(f"Error: '{args.path}' is not a directory.", file=sys.stderr)
         sys.exit(1)
 
-    tree = generate_tree(
+    root_name = os.path.basename(os.path.abspath(args.path)) or args.path
+    lines = walk_tree(
         args.path,
         dirs_only=args.dirs_only,
         max_depth=args.depth,
         exclude=args.exclude,
         include=args.include,
+        jobs=args.jobs,
+        skip_hidden=args.skip_hidden,
     )
 
+    # Stream line by line instead of materialising the whole tree first,
+    # writing encoded bytes through a large binary buffer so the text
+    # layer doesn't re-encode per line
     if args.output:
-        with open(args.output, "w", encoding="utf-8") as f:
-            f.write(tree + "\n")
+        with open(args.output, "wb", buffering=1 << 20) as f:
+            f.write(f"{root_name}/\n".encode("utf-8"))
+            for line in lines:
+                f.write(line.encode("utf-8"))
+                f.write(b"\n")
         print(f"Tree written to {args.output}")
     else:
-        print(tree)
+        out = sys.stdout.buffer
+        out.write(f"{root_name}/\n".encode("utf-8"))
+        for line in lines:
+            out.write(line.encode("utf-8"))
+            out.write(b"\n")
+        out.flush()
 
 
 if __name__ == "__main__":
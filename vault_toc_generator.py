@@ -14,23 +14,53 @@ No admin privileges or third-party packages required — pure Python 3.
 """
 
 import argparse
+import io
 import os
 import re
 import sys
 from pathlib import Path
 
+# Markdown markers matched per line while parsing; the link regex is
+# compiled once here, and the fixed prefixes use str.startswith rather
+# than the regex engine.
+_SECTION_PREFIX = "### "
+_SUBSECTION_PREFIX = "#### "
+_LINK_PREFIX = "- [["
+_LINK_RE = re.compile(r"\[\[(.*?)\]\]")
+
+# Single-pass character maps for Mermaid labels; chained str.replace
+# calls rescan and reallocate the string once per character handled.
+_PAREN_TRANS = str.maketrans({"(": " ", ")": " "})
+_QUOTE_TRANS = str.maketrans({'"': '\\"'})
+_MD_EXT_RE = re.compile(r"\.md$", re.IGNORECASE)
+
+
+def _strip_md(name):
+    """Drop a trailing .md extension from a note name."""
+    return _MD_EXT_RE.sub("", name)
+
+
+def _mindmap_label(name):
+    """Blank out parentheses, which break Mermaid mindmap node syntax."""
+    return name.translate(_PAREN_TRANS).strip()
+
+
+def _quoted_label(name):
+    """Escape double quotes for quoted Mermaid flowchart labels."""
+    return name.translate(_QUOTE_TRANS)
+
 
 def scan_folder(path, exclude=None):
     """Scan folder and return list of all files (case-insensitive)."""
-    exclude = exclude or [".git", ".obsidian", ".DS_Store", "node_modules"]
+    exclude = frozenset(exclude or (".git", ".obsidian", ".DS_Store", "node_modules"))
 
     try:
-        entries = sorted([
-            e for e in os.listdir(path)
-            if os.path.isfile(os.path.join(path, e))
-            and e not in exclude
-        ])
-        return entries
+        # DirEntry caches the type bit, so no per-entry join + stat
+        with os.scandir(path) as it:
+            return sorted(
+                e.name for e in it
+                if e.is_file(follow_symlinks=False) and e.name not in exclude
+            )
     except PermissionError:
         print(f"Error: Permission denied reading {path}", file=sys.stderr)
         return []
@@ -38,40 +68,39 @@ def scan_folder(path, exclude=None):
 
 def generate_template_markdown(files, title="Table of Contents"):
     """Generate editable markdown template."""
-    lines = [
-        f"# {title}",
-        "",
-        "## How to Use This Template",
-        "",
-        "1. Edit the sections below to organize your files",
-        "2. Use `### Section Name` for main sections",
-        "3. Use `#### Subsection Name` for sub-sections (optional)",
-        "4. Move file links between sections as needed",
-        "5. Delete unused section headers",
-        "6. Run the tool again to regenerate the mermaid diagram",
-        "",
-        "---",
-        "",
-        "## Files by Section",
-        ""
-    ]
-
-    lines.append("### Section 1: First Half")
-    lines.append("")
-    lines.append("<!-- Add your files here -->")
-    lines.append("")
-    lines.extend([f"- [[{f}]]" for f in files[:len(files)//2]])
-    lines.append("")
-    lines.append("")
-
-    lines.append("### Section 2: Second Half")
-    lines.append("")
-    lines.append("<!-- Add your files here -->")
-    lines.append("")
-    lines.extend([f"- [[{f}]]" for f in files[len(files)//2:]])
-    lines.append("")
-
-    return "\n".join(lines)
+    out = io.StringIO()
+    out.write(f"""# {title}
+
+## How to Use This Template
+
+1. Edit the sections below to organize your files
+2. Use `### Section Name` for main sections
+3. Use `#### Subsection Name` for sub-sections (optional)
+4. Move file links between sections as needed
+5. Delete unused section headers
+6. Run the tool again to regenerate the mermaid diagram
+
+---
+
+## Files by Section
+
+""")
+
+    # Single pass over files — the split point is just an index, so there
+    # is no need to slice the list into two halves first
+    mid = len(files) // 2
+    section_two = "\n\n### Section 2: Second Half\n\n<!-- Add your files here -->\n\n"
+
+    out.write("### Section 1: First Half\n\n<!-- Add your files here -->\n\n")
+    for i, f in enumerate(files):
+        if i == mid:
+            out.write(section_two)
+        out.write(f"- [[{f}]]\n")
+    if mid >= len(files):
+        # No files at all: the split point was never reached in the loop
+        out.write(section_two)
+
+    return out.getvalue()
 
 
 def parse_markdown_structure(markdown_text, title):
@@ -83,8 +112,8 @@ def parse_markdown_structure(markdown_text, title):
 
     for line in lines:
         # Main section (### heading)
-        if re.match(r'^### ', line):
-            section_name = line.replace('### ', '').strip()
+        if line.startswith(_SECTION_PREFIX):
+            section_name = line[len(_SECTION_PREFIX):].strip()
             current_section = {
                 'name': section_name,
                 'files': [],
@@ -94,8 +123,8 @@ def parse_markdown_structure(markdown_text, title):
             sections.append(current_section)
 
         # Subsection (#### heading)
-        elif re.match(r'^#### ', line):
-            subsection_name = line.replace('#### ', '').strip()
+        elif line.startswith(_SUBSECTION_PREFIX):
+            subsection_name = line[len(_SUBSECTION_PREFIX):].strip()
             if current_section:
                 current_subsection = {
                     'name': subsection_name,
@@ -104,8 +133,8 @@ def parse_markdown_structure(markdown_text, title):
                 current_section['subsections'].append(current_subsection)
 
         # File link
-        elif re.match(r'^- \[\[', line):
-            file_name = re.search(r'\[\[(.*?)\]\]', line)
+        elif line.startswith(_LINK_PREFIX):
+            file_name = _LINK_RE.search(line)
             if file_name:
                 link = file_name.group(1)
                 if current_subsection:
@@ -118,98 +147,102 @@ def parse_markdown_structure(markdown_text, title):
 
 def generate_mermaid_mindmap(config):
     """Generate a Mermaid mindmap diagram with subsections."""
-    lines = ["```mermaid", "mindmap"]
+    out = io.StringIO()
+    out.write("```mermaid\nmindmap\n")
     title = config['title']
-    lines.append(f"  root((\"{title}\"))")
+    out.write(f"  root((\"{title}\"))\n")
 
     click_lines = []
     node_id = 0
 
-    for section in config.get("sections", []):
+    for section in config.get("sections") or ():
         section_name = section["name"]
-        safe_section = section_name.replace("(", " ").replace(")", " ").strip()
-        lines.append(f"    {safe_section}")
+        safe_section = _mindmap_label(section_name)
+        out.write(f"    {safe_section}\n")
 
         # Add files from this section (not in subsections)
-        for file in section.get("files", []):
-            file_name = file.replace(".md", "").replace(".MD", "")
-            safe_file = file_name.replace("(", " ").replace(")", " ").strip()
-            lines.append(f"      {safe_file}")
+        for file in section.get("files") or ():
+            file_name = _strip_md(file)
+            safe_file = _mindmap_label(file_name)
+            out.write(f"      {safe_file}\n")
             # Store click handler
-            safe_link = file.replace('"', '\\"')
             click_lines.append(f"click mm_{node_id} \"[[{file}]]\"")
             node_id += 1
 
         # Add subsections
-        for subsection in section.get("subsections", []):
+        for subsection in section.get("subsections") or ():
             sub_name = subsection["name"]
-            safe_sub = sub_name.replace("(", " ").replace(")", " ").strip()
-            lines.append(f"      {safe_sub}")
+            safe_sub = _mindmap_label(sub_name)
+            out.write(f"      {safe_sub}\n")
 
-            for file in subsection.get("files", []):
-                file_name = file.replace(".md", "").replace(".MD", "")
-                safe_file = file_name.replace("(", " ").replace(")", " ").strip()
-                lines.append(f"        {safe_file}")
+            for file in subsection.get("files") or ():
+                file_name = _strip_md(file)
+                safe_file = _mindmap_label(file_name)
+                out.write(f"        {safe_file}\n")
                 # Store click handler
-                safe_link = file.replace('"', '\\"')
                 click_lines.append(f"click mm_{node_id} \"[[{file}]]\"")
                 node_id += 1
 
-    lines.extend(click_lines)
-    lines.append("```")
-    return "\n".join(lines)
+    for line in click_lines:
+        out.write(line)
+        out.write("\n")
+    out.write("```")
+    return out.getvalue()
 
 
 def generate_mermaid_flowchart(config):
     """Generate a Mermaid flowchart diagram with subsections."""
-    lines = ["```mermaid", "flowchart TD"]
+    out = io.StringIO()
+    out.write("```mermaid\nflowchart TD\n")
 
     # Root node
     root_id = "root"
     title = config['title']
-    safe_title = title.replace('"', '\\"')
-    lines.append(f"    {root_id}[\"{safe_title}\"]")
+    safe_title = _quoted_label(title)
+    out.write(f"    {root_id}[\"{safe_title}\"]\n")
 
     # Sections and files
     node_counter = 0
     click_lines = []
 
-    for section_idx, section in enumerate(config.get("sections", [])):
+    for section_idx, section in enumerate(config.get("sections") or ()):
         section_name = section["name"]
         section_id = f"section_{section_idx}"
-        safe_section = section_name.replace('"', '\\"')
-        lines.append(f"    {section_id}[\"{safe_section}\"]")
-        lines.append(f"    {root_id} --> {section_id}")
+        safe_section = _quoted_label(section_name)
+        out.write(f"    {section_id}[\"{safe_section}\"]\n")
+        out.write(f"    {root_id} --> {section_id}\n")
 
         # Files directly in section
-        for file_idx, file in enumerate(section.get("files", [])):
-            file_name = file.replace(".md", "").replace(".MD", "")
-            safe_file = file_name.replace('"', '\\"')
+        for file_idx, file in enumerate(section.get("files") or ()):
+            file_name = _strip_md(file)
+            safe_file = _quoted_label(file_name)
             file_id = f"file_{section_idx}_{node_counter}"
-            lines.append(f"    {file_id}[\"{safe_file}\"]")
-            lines.append(f"    {section_id} --> {file_id}")
+            out.write(f"    {file_id}[\"{safe_file}\"]\n")
+            out.write(f"    {section_id} --> {file_id}\n")
             click_lines.append(f"    click {file_id} \"[[{file}]]\"")
             node_counter += 1
 
         # Subsections
-        for sub_idx, subsection in enumerate(section.get("subsections", [])):
+        for sub_idx, subsection in enumerate(section.get("subsections") or ()):
             sub_name = subsection["name"]
             sub_id = f"subsection_{section_idx}_{sub_idx}"
-            safe_sub = sub_name.replace('"', '\\"')
-            lines.append(f"    {sub_id}[\"{safe_sub}\"]")
-            lines.append(f"    {section_id} --> {sub_id}")
+            safe_sub = _quoted_label(sub_name)
+            out.write(f"    {sub_id}[\"{safe_sub}\"]\n")
+            out.write(f"    {section_id} --> {sub_id}\n")
 
-            for file_idx, file in enumerate(subsection.get("files", [])):
-                file_name = file.replace(".md", "").replace(".MD", "")
-                safe_file = file_name.replace('"', '\\"')
+            for file_idx, file in enumerate(subsection.get("files") or ()):
+                file_name = _strip_md(file)
+                safe_file = _quoted_label(file_name)
                 file_id = f"subfile_{section_idx}_{sub_idx}_{file_idx}"
-                lines.append(f"    {file_id}[\"{safe_file}\"]")
-                lines.append(f"    {sub_id} --> {file_id}")
+                out.write(f"    {file_id}[\"{safe_file}\"]\n")
+                out.write(f"    {sub_id} --> {file_id}\n")
                 click_lines.append(f"    click {file_id} \"[[{file}]]\"")
 
-    lines.extend(click_lines)
-    lines.append("```")
-    return "\n".join(lines)
+    for line in click_lines:
+        out.write(line)
+        out.write("\n")
+    out.write("```")
+    return out.getvalue()
 
 
 def generate_markdown_with_diagram(config, markdown_content, diagram_type="mindmap"):
@@ -296,8 +329,8 @@ examples:
         markdown = generate_template_markdown(files, args.title)
 
         if args.output:
-            with open(args.output, "w", encoding="utf-8") as f:
-                f.write(markdown)
+            with open(args.output, "wb", buffering=1 << 20) as f:
+                f.write(markdown.encode("utf-8"))
             print(f"✓ Template written to {args.output}")
             print("Edit this file to organize files, then regenerate with: python vault_toc_generator.py -i <file> -d <style>")
         else:
@@ -320,8 +353,8 @@ examples:
         result_markdown = generate_markdown_with_diagram(config, markdown_content, args.diagram)
 
         if args.output:
-            with open(args.output, "w", encoding="utf-8") as f:
-                f.write(result_markdown)
+            with open(args.output, "wb", buffering=1 << 20) as f:
+                f.write(result_markdown.encode("utf-8"))
             print(f"✓ Markdown with {args.diagram} diagram written to {args.output}")
         else:
             print("\n" + "=" * 60)